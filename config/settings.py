@@ -35,8 +35,7 @@ FILE_EXTENSIONS = {
     LAYER_TYPES['FEATURES']: 'json'
 }
 
-with open(ROOT_DIR / 'color_scale.json', 'r') as f:  # Update color scale path
-    color_scale = json.load(f)
+color_scale = json.loads((ROOT_DIR / 'color_scale.json').read_bytes())
 
 IMAGE_SETTINGS = {
     'colors': color_scale['colors'],
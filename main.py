@@ -26,22 +26,23 @@ async def main():
         async with aiohttp.ClientSession() as session:
             await processing_manager.initialize(session)
             
-            for region_id in REGIONS:
-                for dataset in SOURCES:
-                    try:
-                        result = await processing_manager.process_dataset(
-                            date=datetime.now(),
-                            region_id=region_id,
-                            dataset=dataset,
-                            skip_geojson=False
-                        )
+            with processing_manager.data_assembler.buffered():
+                for region_id in REGIONS:
+                    for dataset in SOURCES:
+                        try:
+                            result = await processing_manager.process_dataset(
+                                date=datetime.now(),
+                                region_id=region_id,
+                                dataset=dataset,
+                                skip_geojson=False
+                            )
                         
-                        if result['status'] != 'success':
-                            logger.error(f"Failed {dataset} for {region_id}: {result.get('error', 'Unknown error')}")
+                            if result['status'] != 'success':
+                                logger.error(f"Failed {dataset} for {region_id}: {result.get('error', 'Unknown error')}")
                             
-                    except Exception as e:
-                        logger.error(f"Error processing {dataset} for {region_id}: {str(e)}")
-                        continue
+                        except Exception as e:
+                            logger.error(f"Error processing {dataset} for {region_id}: {str(e)}")
+                            continue
         
         logger.info("Processing completed")
         
@@ -1,14 +1,24 @@
-import json
+import orjson
+import os
+import bisect
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 import logging
-from typing import Dict
+from typing import Dict, Optional, Tuple
 
 from config.settings import SOURCES, SERVER_URL, LAYER_TYPES, FILE_EXTENSIONS, PATHS
 from config.regions import REGIONS
 
 logger = logging.getLogger(__name__)
 
+# Region id -> (region entry, dataset id -> dataset entry)
+MetadataIndex = Dict[str, Tuple[dict, Dict[str, dict]]]
+
+def _date_sort_key(date_entry: dict) -> int:
+    """Ascending key for date entries stored newest first."""
+    return -int(date_entry["date"])
+
 class DataAssembler:
     """Manages asset paths and metadata for the front-end API endpoint."""
     
@@ -16,6 +26,10 @@ class DataAssembler:
         self.base_dir = base_dir
         self.data_dir = PATHS['DATA_DIR']
         self.data_dir.mkdir(parents=True, exist_ok=True)
+        self.metadata_path = PATHS['API_DIR'] / "metadata.json"
+        self._metadata_cache: Dict[Path, Tuple[Optional[int], dict, MetadataIndex]] = {}
+        self._deferred = False
+        self._dirty = False
 
     def get_asset_paths(self, date: datetime, dataset: str, region: str) -> Dict[str, Path]:
         """Get paths for all assets for a given date, dataset, and region."""
@@ -43,65 +57,135 @@ class DataAssembler:
                 date_entry["ranges"] = ranges
             
             # Load or create metadata file
-            metadata_path = PATHS['API_DIR'] / "metadata.json"
-            if metadata_path.exists():
-                with open(metadata_path) as f:
-                    metadata = json.load(f)
-            else:
-                metadata = {"regions": [], "lastUpdated": datetime.now().isoformat()}
+            metadata, index = self._load_metadata(self.metadata_path)
+
+            # Build any missing region/dataset entries before touching the loaded
+            # metadata, so a bad config lookup cannot leave it half-updated
+            region_entry, dataset_index = index.get(region, (None, None))
+            dataset_entry = dataset_index.get(dataset) if dataset_index else None
+            new_region_entry = None if region_entry else self._create_region_entry(region)
+            new_dataset_entry = None if dataset_entry else self._create_dataset_entry(dataset)
 
             # Find or create region entry with additional metadata from REGIONS config
-            region_entry = next((r for r in metadata["regions"] if r["id"] == region), None)
-            if not region_entry:
-                region_config = REGIONS[region]
-                region_entry = {
-                    "id": region,
-                    "name": region_config["name"],
-                    "bounds": region_config["bounds"],
-                    "datasets": []
-                }
+            if new_region_entry:
+                region_entry = new_region_entry
                 metadata["regions"].append(region_entry)
+                dataset_index = {}
+                index[region] = (region_entry, dataset_index)
 
             # Find or create dataset entry
-            dataset_entry = next((d for d in region_entry["datasets"] if d["id"] == dataset), None)
-            if not dataset_entry:
-                dataset_config = SOURCES[dataset]
-                dataset_entry = {
-                    "id": dataset,
-                    "name": dataset_config["name"],
-                    "type": dataset_config["type"],
-                    "supportedLayers": dataset_config["supportedLayers"],
-                    "metadata": dataset_config["metadata"],
-                    "dates": []
-                }
-                
-                # Add source datasets info for combined views
-                if dataset_config.get('source_type') == 'combined_view':
-                    dataset_entry["source_datasets"] = {
-                        name: {
-                            "id": info["dataset_id"],
-                            "variables": list(info["variables"].keys())
-                        }
-                        for name, info in dataset_config["source_datasets"].items()
-                    }
-                
+            if new_dataset_entry:
+                dataset_entry = new_dataset_entry
                 region_entry["datasets"].append(dataset_entry)
+                dataset_index[dataset] = dataset_entry
 
-            # Update dates
-            dataset_entry["dates"] = [d for d in dataset_entry["dates"] if d["date"] != date_entry["date"]]
-            dataset_entry["dates"].append(date_entry)
-            dataset_entry["dates"].sort(key=lambda x: x["date"], reverse=True)
+            # Update dates, keeping the list sorted newest first
+            dates = dataset_entry["dates"]
+            pos = bisect.bisect_left(dates, _date_sort_key(date_entry), key=_date_sort_key)
+            if pos < len(dates) and dates[pos]["date"] == date_entry["date"]:
+                # Nothing to write when a rerun produces the same entry
+                if dates[pos] == date_entry:
+                    return
+                dates[pos] = date_entry
+            else:
+                dates.insert(pos, date_entry)
 
-            # Save metadata
+            # Save metadata, or leave it in memory until flush() when buffered
             metadata["lastUpdated"] = datetime.now().isoformat()
-            metadata_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(metadata_path, 'w') as f:
-                json.dump(metadata, f, indent=2)
+            if self._deferred:
+                self._dirty = True
+            else:
+                self._save_metadata(self.metadata_path, metadata, index)
             
         except Exception as e:
+            if not self._deferred:
+                self._metadata_cache.pop(self.metadata_path, None)
             logger.error(f"Error updating metadata: {str(e)}")
             raise
 
+    def _create_region_entry(self, region: str) -> dict:
+        """Create a metadata region entry from the REGIONS config."""
+        region_config = REGIONS[region]
+        return {
+            "id": region,
+            "name": region_config["name"],
+            "bounds": region_config["bounds"],
+            "datasets": []
+        }
+
+    def _create_dataset_entry(self, dataset: str) -> dict:
+        """Create a metadata dataset entry from the SOURCES config."""
+        dataset_config = SOURCES[dataset]
+        dataset_entry = {
+            "id": dataset,
+            "name": dataset_config["name"],
+            "type": dataset_config["type"],
+            "supportedLayers": dataset_config["supportedLayers"],
+            "metadata": dataset_config["metadata"],
+            "dates": []
+        }
+        
+        # Add source datasets info for combined views
+        if dataset_config.get('source_type') == 'combined_view':
+            dataset_entry["source_datasets"] = {
+                name: {
+                    "id": info["dataset_id"],
+                    "variables": list(info["variables"].keys())
+                }
+                for name, info in dataset_config["source_datasets"].items()
+            }
+        return dataset_entry
+
+    @contextmanager
+    def buffered(self):
+        """Defer metadata writes inside the block and write the file once on exit."""
+        self._deferred = True
+        try:
+            yield self
+        finally:
+            self._deferred = False
+            self.flush()
+
+    def flush(self):
+        """Write pending metadata updates to disk."""
+        if not self._dirty:
+            return
+        cached = self._metadata_cache.get(self.metadata_path)
+        if cached:
+            self._save_metadata(self.metadata_path, cached[1], cached[2])
+        self._dirty = False
+
+    def _load_metadata(self, metadata_path: Path) -> Tuple[dict, MetadataIndex]:
+        """Load metadata JSON and its region/dataset index, reusing the parsed copy while the file is unchanged on disk."""
+        cached = self._metadata_cache.get(metadata_path)
+        if cached and self._dirty:
+            # Buffered updates live only in the cached copy; reloading would drop them
+            return cached[1], cached[2]
+        mtime = metadata_path.stat().st_mtime_ns if metadata_path.exists() else None
+        if cached and cached[0] == mtime:
+            return cached[1], cached[2]
+        
+        if mtime is None:
+            metadata = {"regions": [], "lastUpdated": datetime.now().isoformat()}
+        else:
+            metadata = orjson.loads(metadata_path.read_bytes())
+        
+        # Index region and dataset entries by id for direct lookup
+        index = {
+            r["id"]: (r, {d["id"]: d for d in r["datasets"]})
+            for r in metadata["regions"]
+        }
+        self._metadata_cache[metadata_path] = (mtime, metadata, index)
+        return metadata, index
+
+    def _save_metadata(self, metadata_path: Path, metadata: dict, index: MetadataIndex):
+        """Atomically write metadata JSON and remember it as the current parsed copy."""
+        metadata_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = metadata_path.with_suffix('.json.tmp')
+        tmp_path.write_bytes(orjson.dumps(metadata, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+        os.replace(tmp_path, metadata_path)
+        self._metadata_cache[metadata_path] = (metadata_path.stat().st_mtime_ns, metadata, index)
+
     def _get_layer_urls(self, paths: Dict[str, str]) -> Dict[str, str]:
         """Convert local paths to front-end URLs."""
         urls = {}
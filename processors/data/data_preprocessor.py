@@ -1,17 +1,53 @@
 import xarray as xr
 import numpy as np
 import logging
-from shapely.geometry import Point
+import functools
 from cartopy.feature import NaturalEarthFeature
 from typing import Optional
 
 logger = logging.getLogger(__name__)
 
+TEMPERATURE_VARIABLES = frozenset(['analysed_sst', 'sea_surface_temperature', 'thetao'])
+
+@functools.lru_cache(maxsize=1)
+def _load_land_geometries() -> list:
+    """Load Natural Earth 10m land polygons once per process."""
+    return list(NaturalEarthFeature('physical', 'land', '10m').geometries())
+
+@functools.lru_cache(maxsize=32)
+def _temperature_variables(var_names: tuple) -> tuple:
+    """Resolve which variables hold temperatures, once per variable layout."""
+    return tuple(var for var in var_names
+                 if 'temperature' in var.lower() or var in TEMPERATURE_VARIABLES)
+
+@functools.lru_cache(maxsize=64)
+def _resolve_chl_schema(coord_names: tuple, var_names: tuple) -> tuple:
+    """Resolve (lon_name, lat_name, chl_var) once per coordinate/variable layout."""
+    lon_name = 'longitude' if 'longitude' in coord_names else 'lon'
+    lat_name = 'latitude' if 'latitude' in coord_names else 'lat'
+    chl_var = 'chlor_a' if 'chlor_a' in var_names else next(
+        (var for var in var_names if 'CHL' in var.upper()), None)
+    return lon_name, lat_name, chl_var
+
 class DataPreprocessor:
     def __init__(self):
-        # Initialize land mask data
-        self.land = NaturalEarthFeature('physical', 'land', '10m')
-        self.land_geoms = list(self.land.geometries())
+        # Type-specific cleaning steps, resolved once instead of branching per call
+        self._cleaners = {
+            'chlorophyll': self._clean_chlorophyll,
+            'sst': self._convert_temperatures,
+        }
+
+    @property
+    def land_geoms(self) -> list:
+        """Land polygons, loaded on first access and shared by all instances."""
+        return _load_land_geometries()
+
+    def _resolve_schema(self, data: xr.Dataset) -> tuple:
+        """Return (lon_name, lat_name, chl_var) for the dataset's layout."""
+        lon_name, lat_name, chl_var = _resolve_chl_schema(tuple(data.coords), tuple(data.data_vars))
+        if chl_var is None:
+            raise ValueError("No chlorophyll variable found in dataset")
+        return lon_name, lat_name, chl_var
 
     def _convert_temperature(self, data: xr.Dataset, var_name: str) -> xr.DataArray:
         """Convert temperature from Celsius to Fahrenheit using xarray operations.
@@ -31,12 +67,11 @@ class DataPreprocessor:
             logger.info(f"Variable {var_name} already in Fahrenheit")
             return temp_data
             
-        # Convert using xarray's where to handle NaN values properly
-        converted = xr.where(
-            np.isnan(temp_data),
-            temp_data,  # Keep NaN values as is
-            temp_data * 1.8 + 32
-        )
+        # Scale and shift the raw array in place so only one full-size temporary
+        # is built; NaN propagates through the arithmetic, so no NaN guard is needed
+        values = temp_data.values * 1.8
+        values += 32
+        converted = temp_data.copy(data=values)
         
         # Preserve all original metadata and update only unit-related attributes
         converted.attrs = temp_data.attrs.copy()
@@ -63,17 +98,16 @@ class DataPreprocessor:
         Returns:
             Boolean mask where True indicates water, False indicates land
         """
-        # Get coordinate names
-        lon_name = 'longitude' if 'longitude' in data.coords else 'lon'
-        lat_name = 'latitude' if 'latitude' in data.coords else 'lat'
+        # Get coordinate names and the chlorophyll variable
+        lon_name, lat_name, chl_var = self._resolve_schema(data)
         logger.info(f"Using coordinates: {lon_name}, {lat_name}")
         
         # Get the chlorophyll data
-        chl_var = 'chlor_a' if 'chlor_a' in data else next(var for var in data.data_vars if 'CHL' in var.upper())
         values = data[chl_var].values
         
-        # Simple mask: NaN or very high values typically indicate land
-        water_mask = ~(np.isnan(values) | (values > 20))  # Values > 20 mg/m³ are unrealistic for ocean
+        # Simple mask: NaN or very high values typically indicate land.
+        # NaN compares False, so one comparison covers both cases.
+        water_mask = values <= 20  # Values > 20 mg/m³ are unrealistic for ocean
         
         logger.info("Land mask generation complete")
         return water_mask
@@ -88,27 +122,28 @@ class DataPreprocessor:
             Cleaned dataset with land masked and invalid values removed
         """
         try:            
-            # Create copy to avoid modifying input
-            cleaned_data = data.copy()
-            
             # Get chlorophyll variable (chlor_a is standard name)
-            chl_var = 'chlor_a' if 'chlor_a' in data else next(var for var in data.data_vars if 'CHL' in var.upper())
-            
-            # Get water mask and apply transformations
-            values = data[chl_var].values
-            
-            # Remove invalid values (negative, zero, or unrealistically high)
-            values = np.where(values <= 0, np.nan, values)  # Remove negative/zero values
-            values = np.where(values > 20, np.nan, values)  # Remove unrealistic values
+            _, _, chl_var = self._resolve_schema(data)
+            chl = data[chl_var]
             
-            cleaned_data[chl_var].values = values
+            # Keep only realistic values (positive and at most 20 mg/m³); stays lazy for dask-backed data
+            cleaned = chl.where((chl > 0) & (chl <= 20))
             
-            return cleaned_data
+            # Replace just the chlorophyll variable, leaving the input untouched
+            return data.assign({chl_var: cleaned})
                 
         except Exception as e:
             logger.error(f"Failed to clean chlorophyll data: {str(e)}")
             raise
 
+    def _convert_temperatures(self, data: xr.Dataset) -> xr.Dataset:
+        """Convert all temperature variables to Fahrenheit and assign them in one update."""
+        converted = {}
+        for var_name in _temperature_variables(tuple(data.data_vars)):
+            logger.info(f"Converting temperature variable {var_name}")
+            converted[var_name] = self._convert_temperature(data, var_name)
+        return data.assign(converted) if converted else data
+
     def preprocess_dataset(self, data: xr.Dataset | xr.DataArray, dataset_type: str = None) -> xr.Dataset:
         """Preprocess dataset by flattening time dimension, removing depth, and applying type-specific cleaning.
         
@@ -121,25 +156,15 @@ class DataPreprocessor:
         """
         data = data.to_dataset() if isinstance(data, xr.DataArray) else data
         
-        if 'time' in data.dims:
-            data = data.isel(time=0)
-
-        if 'depth' in data.dims:
-            data = data.isel(depth=0, drop=True)
-
-        if 'altitude' in data.dims:
-            data = data.isel(altitude=0, drop=True)
+        # Select the first time/depth/altitude slice in a single isel
+        indexers = {dim: 0 for dim in ('time', 'depth', 'altitude') if dim in data.dims}
+        if indexers:
+            data = data.isel(indexers)
+            data = data.drop_vars([dim for dim in ('depth', 'altitude') if dim in indexers], errors='ignore')
 
         # Apply type-specific cleaning
-        if dataset_type == 'chlorophyll':
-            data = self._clean_chlorophyll(data)
-        elif dataset_type == 'sst':
-            # Convert all temperature variables to Fahrenheit
-            temp_vars = [var for var in data.data_vars 
-                        if 'temperature' in var.lower() 
-                        or var in ['analysed_sst', 'sea_surface_temperature', 'thetao']]
-            for var_name in temp_vars:
-                logger.info(f"Converting temperature variable {var_name}")
-                data[var_name] = self._convert_temperature(data, var_name)
+        cleaner = self._cleaners.get(dataset_type)
+        if cleaner is not None:
+            data = cleaner(data)
 
         return data
\ No newline at end of file
@@ -1,47 +1,48 @@
-from typing import Dict, Type, Final
+import importlib
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Optional, Type, Final
 
-# Import visualizers
-from processors.visualization.sst_visualizer import SSTVisualizer
-from processors.visualization.currents_visualizer import CurrentsVisualizer
-from processors.visualization.chlorophyll_visualizer import ChlorophyllVisualizer
-from processors.visualization.waves_visualizer import WavesVisualizer
-from processors.visualization.water_movement_visualizer import WaterMovementVisualizer
+@dataclass(frozen=True, slots=True)
+class ProcessorBundle:
+    """Processor classes for one dataset type, as 'module:Class' paths."""
+    visualizer: str
+    geojson: str
+    contours: Optional[str] = None
+    features: Optional[str] = None
 
-# Import converters
-from processors.geojson.sst_converter import SSTGeoJSONConverter
-from processors.geojson.sst_contour_converter import SSTContourConverter
-from processors.geojson.currents_converter import CurrentsGeoJSONConverter
-from processors.geojson.chlorophyll_converter import ChlorophyllGeoJSONConverter
-from processors.geojson.chlorophyll_contour_converter import ChlorophyllContourConverter
-from processors.geojson.waves_converter import WavesGeoJSONConverter
-from processors.geojson.water_movement_converter import WaterMovementConverter
-from processors.geojson.water_movement_contour_converter import WaterMovementContourConverter
-from processors.geojson.fishing_spots_converter import FishingSpotConverter
+# Processor type mapping. Classes are referenced as 'module:Class' and imported
+# on first use, so loading this module does not import every visualizer and
+# converter (and their scipy/skimage/cartopy dependencies) up front.
+PROCESSOR_MAPPING: Final[Dict[str, ProcessorBundle]] = {
+    'sst': ProcessorBundle(
+        visualizer='processors.visualization.sst_visualizer:SSTVisualizer',
+        geojson='processors.geojson.sst_converter:SSTGeoJSONConverter',
+        contours='processors.geojson.sst_contour_converter:SSTContourConverter'
+    ),
+    'water_movement': ProcessorBundle(
+        visualizer='processors.visualization.water_movement_visualizer:WaterMovementVisualizer',
+        geojson='processors.geojson.water_movement_converter:WaterMovementConverter',
+        contours='processors.geojson.water_movement_contour_converter:WaterMovementContourConverter',
+        features='processors.geojson.fishing_spots_converter:FishingSpotConverter'
+    ),
+    'waves': ProcessorBundle(
+        visualizer='processors.visualization.waves_visualizer:WavesVisualizer',
+        geojson='processors.geojson.waves_converter:WavesGeoJSONConverter'
+    ),
+    'currents': ProcessorBundle(
+        visualizer='processors.visualization.currents_visualizer:CurrentsVisualizer',
+        geojson='processors.geojson.currents_converter:CurrentsGeoJSONConverter'
+    ),
+    'chlorophyll': ProcessorBundle(
+        visualizer='processors.visualization.chlorophyll_visualizer:ChlorophyllVisualizer',
+        geojson='processors.geojson.chlorophyll_converter:ChlorophyllGeoJSONConverter',
+        contours='processors.geojson.chlorophyll_contour_converter:ChlorophyllContourConverter'
+    )
+}
 
-# Processor type mapping
-PROCESSOR_MAPPING: Final[Dict] = {
-    'sst': {
-        'visualizer': SSTVisualizer,
-        'geojson': SSTGeoJSONConverter,
-        'contours': SSTContourConverter
-    },
-    'water_movement': {
-        'visualizer': WaterMovementVisualizer,
-        'geojson': WaterMovementConverter,
-        'contours': WaterMovementContourConverter,
-        'features': FishingSpotConverter
-    },
-    'waves': {
-        'visualizer': WavesVisualizer,
-        'geojson': WavesGeoJSONConverter
-    },
-    'currents': {
-        'visualizer': CurrentsVisualizer,
-        'geojson': CurrentsGeoJSONConverter
-    },
-    'chlorophyll': {
-        'visualizer': ChlorophyllVisualizer,
-        'geojson': ChlorophyllGeoJSONConverter,
-        'contours': ChlorophyllContourConverter
-    }
-} 
\ No newline at end of file
+@lru_cache(maxsize=None)
+def load_processor(path: str) -> Type:
+    """Import and return the processor class referenced by a 'module:Class' path."""
+    module_name, class_name = path.split(':')
+    return getattr(importlib.import_module(module_name), class_name)
@@ -1,10 +1,11 @@
 from abc import ABC, abstractmethod
 from pathlib import Path
 import logging
+import os
 import xarray as xr
 import numpy as np
-import json
-from typing import Callable, Dict, List, Optional, Tuple, Union, Any
+import orjson
+from typing import Dict, List, Tuple, Union, Any
 from utils.path_manager import PathManager
 from datetime import datetime
 from config.settings import SOURCES
@@ -37,77 +38,69 @@ class BaseGeoJSONConverter(ABC):
     
     def get_coordinate_names(self, data: xr.Dataset) -> tuple:
         """Get standardized coordinate names."""
-        lon_patterns = ['lon', 'longitude', 'x']
-        lat_patterns = ['lat', 'latitude', 'y']
-        
-        lon_name = None
-        lat_name = None
-        
-        for var in data.coords:
-            var_lower = var.lower()
-            if any(pattern in var_lower for pattern in lon_patterns):
-                lon_name = var
-            elif any(pattern in var_lower for pattern in lat_patterns):
-                lat_name = var
-                
-        if not lon_name or not lat_name:
-            raise ValueError("Could not identify coordinate variables")
-            
-        return lon_name, lat_name
+        return get_coordinate_names(data)
 
     def _generate_features(self, 
                          lats: np.ndarray, 
                          lons: np.ndarray,
-                         property_generator: Callable[[int, int], Optional[Dict]]) -> List[Dict]:
+                         values: Dict[str, np.ndarray]) -> List[Dict]:
         """
-        Generate GeoJSON features using a property generator callback.
+        Generate GeoJSON point features for every grid cell with valid values.
         
         Args:
             lats: Latitude values array
             lons: Longitude values array
-            property_generator: Callback function that takes (i, j) indices and returns properties dict or None
+            values: Mapping of property names to 2-D (lat, lon) ndarrays; cells where any of them is NaN are skipped
             
         Returns:
             List of GeoJSON features
         """
-        features = []
-        for i in range(len(lats)):
-            for j in range(len(lons)):
-                properties = property_generator(i, j)
-                if properties is None:  # Skip if any values are NaN
-                    continue
-                    
-                feature = {
-                    "type": "Feature",
-                    "geometry": {
-                        "type": "Point",
-                        "coordinates": [
-                            self._round_coordinates(float(lons[j])),
-                            self._round_coordinates(float(lats[i]))
-                        ]
-                    },
-                    "properties": properties
-                }
-                features.append(feature)
-        return features
+        names = list(values)
+        arrays = list(values.values())
+        valid = np.ones(arrays[0].shape, dtype=bool)
+        for arr in arrays:
+            valid &= ~np.isnan(arr)
+        
+        # Keep the valid points as parallel columns and only build dicts in the final pass
+        i_idx, j_idx = np.nonzero(valid)
+        # Round in float64; float32 values print with trailing noise after tolist()
+        lons_valid = np.round(np.asarray(lons, dtype=np.float64), 3)[j_idx].tolist()
+        lats_valid = np.round(np.asarray(lats, dtype=np.float64), 3)[i_idx].tolist()
+        columns = [arr[i_idx, j_idx].tolist() for arr in arrays]
+        
+        return [
+            {
+                "type": "Feature",
+                "geometry": {
+                    "type": "Point",
+                    "coordinates": [lon, lat]
+                },
+                "properties": dict(zip(names, row))
+            }
+            for lon, lat, *row in zip(lons_valid, lats_valid, *columns)
+        ]
 
     def _calculate_ranges(self, data_dict: Dict[str, Tuple[np.ndarray, str]]) -> Dict[str, Dict]:
         """
         Calculate ranges for multiple variables.
         
         Args:
-            data_dict: Dictionary mapping variable names to (data, unit) tuples
+            data_dict: Dictionary mapping variable names to (ndarray, unit) tuples; pass
+                raw arrays (DataArray.values), not DataArrays
             
         Returns:
             Dictionary of ranges with min, max, and unit for each variable
         """
         ranges = {}
         for var_name, (data, unit) in data_dict.items():
-            valid_data = data[~np.isnan(data)]
-            if len(valid_data) > 0:
+            if data.size == 0:
+                continue
+            # NaN-aware reductions avoid building a mask and a compacted copy per variable
+            min_val = float(np.nanmin(data))
+            if not np.isnan(min_val):
                 ranges[var_name] = {
-                    "min": float(np.min(valid_data)),
-                    "max": float(np.max(valid_data)),
+                    "min": min_val,
+                    "max": float(np.nanmax(data)),
                     "unit": unit
                 }
         return ranges
@@ -116,40 +109,58 @@ class BaseGeoJSONConverter(ABC):
         """Round coordinate values to specified precision."""
         return round(value, precision)
 
-    def _optimize_feature(self, feature: dict, round_coords: bool = True) -> dict:
-        """Optimize individual feature data."""
-        if round_coords and feature['geometry']['type'] != 'LineString':
-            # Round coordinates for points, but not for contour lines
-            if isinstance(feature['geometry']['coordinates'][0], (int, float)):
-                feature['geometry']['coordinates'] = [
-                    self._round_coordinates(c) for c in feature['geometry']['coordinates']
-                ]
-            else:
-                feature['geometry']['coordinates'] = [
-                    [self._round_coordinates(c) for c in coord] 
-                    for coord in feature['geometry']['coordinates']
-                ]
+    def _optimize_features(self, features: List[Dict], round_coords: bool = True, precision: int = 3) -> List[Dict]:
+        """Round point coordinates and float properties of all features in bulk."""
+        if round_coords:
+            points = []
+            for feature in features:
+                geometry = feature['geometry']
+                if geometry['type'] == 'LineString':
+                    continue  # Keep full precision for contour lines
+                if isinstance(geometry['coordinates'][0], (int, float)):
+                    points.append(geometry)
+                else:
+                    geometry['coordinates'] = np.round(
+                        np.asarray(geometry['coordinates'], dtype=float), precision
+                    ).tolist()
+            
+            # Round every point's coordinates with one ufunc call
+            if points:
+                rounded = np.round(
+                    np.array([geometry['coordinates'] for geometry in points], dtype=float), precision
+                ).tolist()
+                for geometry, coordinates in zip(points, rounded):
+                    geometry['coordinates'] = coordinates
         
-        # Round numeric properties
-        for key, value in feature['properties'].items():
-            if isinstance(value, float):
-                feature['properties'][key] = self._round_coordinates(value)
+        # Gather float properties across all features, round once and scatter back
+        targets = []
+        values = []
+        for feature in features:
+            properties = feature['properties']
+            for key, value in properties.items():
+                if isinstance(value, float):
+                    targets.append((properties, key))
+                    values.append(value)
+        if values:
+            for (properties, key), value in zip(targets, np.round(values, precision).tolist()):
+                properties[key] = value
         
-        return feature
+        return features
 
-    def save_geojson(self, geojson_data: dict, output_path: Path) -> Path:
-        """Save optimized GeoJSON data to file."""
+    def save_geojson(self, geojson_data: dict, output_path: Path, round_coords: bool = True) -> Path:
+        """Save optimized GeoJSON data to file.
+        
+        Pass round_coords=False for features built by _generate_features, whose
+        coordinates are already rounded to 3 decimals in float64.
+        """
         if output_path is None:
             logger.error("No output path provided")
             return None
         
         try:
             # Optimize features
-            if 'features' in geojson_data:
-                geojson_data['features'] = [
-                    self._optimize_feature(feature) 
-                    for feature in geojson_data['features']
-                ]
+            if geojson_data.get('features'):
+                self._optimize_features(geojson_data['features'], round_coords=round_coords)
             
             # Optimize metadata/properties
             if 'properties' in geojson_data:
@@ -162,9 +173,27 @@ class BaseGeoJSONConverter(ABC):
             # Ensure directory exists
             output_path.parent.mkdir(parents=True, exist_ok=True)
             
-            # Save file
-            with open(output_path, 'w') as f:
-                json.dump(geojson_data, f, separators=(',', ':'))  # Minimize whitespace
+            # Stream features one at a time so the whole collection is never
+            # held as a single serialized buffer; write to a temp file and swap
+            # it in so a failure never leaves a truncated file behind
+            tmp_path = output_path.with_suffix(output_path.suffix + '.tmp')
+            try:
+                if 'features' not in geojson_data:
+                    tmp_path.write_bytes(orjson.dumps(geojson_data, option=orjson.OPT_SERIALIZE_NUMPY))
+                else:
+                    rest = {key: value for key, value in geojson_data.items() if key != 'features'}
+                    with tmp_path.open('wb') as f:
+                        header = orjson.dumps(rest, option=orjson.OPT_SERIALIZE_NUMPY)[:-1]  # Drop closing brace
+                        f.write(header + (b',"features":[' if rest else b'"features":['))
+                        for index, feature in enumerate(geojson_data['features']):
+                            if index:
+                                f.write(b',')
+                            f.write(orjson.dumps(feature, option=orjson.OPT_SERIALIZE_NUMPY))
+                        f.write(b']}')
+                os.replace(tmp_path, output_path)
+            except Exception:
+                tmp_path.unlink(missing_ok=True)
+                raise
             
             logger.info(f"💾 Generated GeoJSON: {output_path}")
             return output_path
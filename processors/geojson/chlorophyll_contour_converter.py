@@ -62,20 +62,17 @@ class ChlorophyllContourConverter(BaseGeoJSONConverter):
                 raise ValueError(f"Expected xarray.DataArray, got {type(data)}")
             
             # Get coordinate names
-            lon_name = 'longitude' if 'longitude' in data.coords else 'lon'
-            lat_name = 'latitude' if 'latitude' in data.coords else 'lat'
+            lon_name, lat_name = self.get_coordinate_names(data)
             
             # Get valid data
-            data_values = data.values.astype(np.float64)
-            valid_mask = ~np.isnan(data_values)
-            valid_data = data_values[valid_mask]
+            data_values = data.values.astype(np.float32, copy=False)
+            min_val = float(np.nanmin(data_values))
+            max_val = float(np.nanmax(data_values))
             
-            if len(valid_data) == 0:
+            if np.isnan(min_val):
                 logger.warning("No valid chlorophyll data points found")
                 return self.save_empty_geojson(date, dataset, region)
             
-            min_val = float(valid_data.min())
-            max_val = float(valid_data.max())
             logger.info(f"Processing chlorophyll data for {date} with min: {min_val:.4f}, max: {max_val:.4f}")
             
             # Smooth data to focus on significant features
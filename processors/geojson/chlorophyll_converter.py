@@ -13,34 +13,17 @@ class ChlorophyllGeoJSONConverter(BaseGeoJSONConverter):
     
     def _create_features(self, data: xr.Dataset) -> List[Dict]:
         """Create GeoJSON features from chlorophyll data."""
-        features = []
-        
-        # Validate data
-        if len(data['chlor_a'].values[~np.isnan(data['chlor_a'].values)]) == 0:
+        values = data['chlor_a'].transpose('latitude', 'longitude').values
+        if np.isnan(values).all():
             logger.warning("No valid chlorophyll data points found")
-            return features
+            return []
         
         try:
-            # Stack lat/lon coordinates to get all points
-            stacked = data['chlor_a'].stack(points=['latitude', 'longitude'])
-            
-            # Create features for valid points
-            for point in stacked.where(~np.isnan(stacked), drop=True):
-                features.append({
-                    'type': 'Feature',
-                    'geometry': {
-                        'type': 'Point',
-                        'coordinates': [
-                            float(point['longitude'].values),
-                            float(point['latitude'].values)
-                        ]
-                    },
-                    'properties': {
-                        'concentration': float(point.values)
-                    }
-                })
-
-            return features
+            return self._generate_features(
+                data['latitude'].values,
+                data['longitude'].values,
+                {'concentration': values}
+            )
             
         except Exception as e:
             logger.error(f"Error creating chlorophyll features: {str(e)}")
@@ -73,7 +56,7 @@ class ChlorophyllGeoJSONConverter(BaseGeoJSONConverter):
             
             # Save and return path
             asset_paths = self.path_manager.get_asset_paths(date, dataset, region)
-            return self.save_geojson(geojson, asset_paths.data)
+            return self.save_geojson(geojson, asset_paths.data, round_coords=False)
             
         except Exception as e:
             logger.error(f"❌ Failed to convert chlorophyll data: {str(e)}")
@@ -35,7 +35,7 @@ class CurrentsGeoJSONConverter(BaseGeoJSONConverter):
             
             # Save and return path
             asset_paths = self.path_manager.get_asset_paths(date, dataset, region)
-            return self.save_geojson(geojson, asset_paths.data)
+            return self.save_geojson(geojson, asset_paths.data, round_coords=False)
             
         except Exception as e:
             logger.error(f"❌ Failed to convert currents data: {str(e)}")
@@ -50,32 +50,18 @@ class CurrentsGeoJSONConverter(BaseGeoJSONConverter):
         
     def _create_features(self, data: xr.Dataset) -> List[Dict]:
         """Create GeoJSON features from current data."""
-        features = []
-        
         # Get coordinates
         lons = data['longitude'].values
         lats = data['latitude'].values
         
-        # Calculate vector properties
-        magnitude = np.sqrt(data['u']**2 + data['v']**2)
-        direction = np.arctan2(data['v'], data['u'])
+        # Calculate vector properties on the raw arrays
+        u = data['u'].values
+        v = data['v'].values
+        magnitude = np.hypot(u, v)
+        direction = np.arctan2(v, u)
         
-        # Create features for each point
-        for i in range(len(lats)):
-            for j in range(len(lons)):
-                if not np.isnan(magnitude.values[i, j]):
-                    features.append({
-                        'type': 'Feature',
-                        'geometry': {
-                            'type': 'Point',
-                            'coordinates': [float(lons[j]), float(lats[i])]
-                        },
-                        'properties': {
-                            'magnitude': float(magnitude.values[i, j]),
-                            'direction': float(direction.values[i, j]),
-                            'u': float(data['u'].values[i, j]),
-                            'v': float(data['v'].values[i, j])
-                        }
-                    })
-                    
-        return features
+        return self._generate_features(
+            lats,
+            lons,
+            {'magnitude': magnitude, 'direction': direction, 'u': u, 'v': v}
+        )
\ No newline at end of file
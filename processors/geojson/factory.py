@@ -3,11 +3,14 @@ from .base_converter import BaseGeoJSONConverter
 from config.settings import SOURCES
 from processors.data.data_assembler import DataAssembler
 from utils.path_manager import PathManager
-from ..factory_config import PROCESSOR_MAPPING
+from ..factory_config import PROCESSOR_MAPPING, load_processor
 import logging
 
 logger = logging.getLogger(__name__)
 
+# ProcessorBundle fields that hold GeoJSON converters
+CONVERTER_LAYERS = frozenset(['geojson', 'contours', 'features'])
+
 class GeoJSONConverterFactory:
     """Factory for creating GeoJSON converters."""
     
@@ -38,8 +41,9 @@ class GeoJSONConverterFactory:
         if layer_type == 'data':
             layer_type = 'geojson'
             
-        if layer_type not in PROCESSOR_MAPPING[dataset_type]:
+        converter_path = getattr(PROCESSOR_MAPPING[dataset_type], layer_type) if layer_type in CONVERTER_LAYERS else None
+        if converter_path is None:
             raise ValueError(f"Unsupported layer type: {layer_type} for dataset: {dataset_type}")
 
-        converter_class = PROCESSOR_MAPPING[dataset_type][layer_type]
+        converter_class = load_processor(converter_path)
         return converter_class(self.path_manager, self.data_assembler)
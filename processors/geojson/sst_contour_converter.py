@@ -74,14 +74,12 @@ class SSTContourConverter(BaseGeoJSONConverter):
         sst_values = data['sst'].values
         
         # Calculate valid temperature range
-        valid_temps = sst_values[~np.isnan(sst_values)]
-        if len(valid_temps) == 0:
+        min_temp = float(np.nanmin(sst_values))
+        max_temp = float(np.nanmax(sst_values))
+        if np.isnan(min_temp):
             logger.warning("No valid temperature data points found")
             return []
         
-        min_temp = float(np.min(valid_temps))
-        max_temp = float(np.max(valid_temps))
-        
         # Generate contour levels
         levels = self._generate_levels(min_temp, max_temp)
         
@@ -1,12 +1,10 @@
 import xarray as xr
-import numpy as np
 import logging
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List
 from .base_converter import BaseGeoJSONConverter
 from config.settings import SOURCES
-from processors.data.data_utils import convert_temperature_to_f
 
 logger = logging.getLogger(__name__)
 
@@ -22,28 +20,11 @@ class SSTGeoJSONConverter(BaseGeoJSONConverter):
     
     def _create_features(self, data: xr.Dataset) -> List[Dict]:
         """Create GeoJSON features from SST data."""
-        features = []
-        
-        # Get coordinates
-        lons = data['longitude'].values
-        lats = data['latitude'].values
-        
-        # Create features for each point
-        for i in range(len(lats)):
-            for j in range(len(lons)):
-                if not np.isnan(data['sst'].values[i, j]):
-                    features.append({
-                        'type': 'Feature',
-                        'geometry': {
-                            'type': 'Point',
-                            'coordinates': [float(lons[j]), float(lats[i])]
-                        },
-                        'properties': {
-                            'temperature': float(data['sst'].values[i, j])
-                        }
-                    })
-                    
-        return features
+        return self._generate_features(
+            data['latitude'].values,
+            data['longitude'].values,
+            {'temperature': data['sst'].values}
+        )
     
     def convert(self, data: xr.Dataset, region: str, dataset: str, date: datetime) -> Path:
         """Convert SST data to GeoJSON format."""
@@ -69,7 +50,7 @@ class SSTGeoJSONConverter(BaseGeoJSONConverter):
             
             # Save and return path
             asset_paths = self.path_manager.get_asset_paths(date, dataset, region)
-            return self.save_geojson(geojson, asset_paths.data)
+            return self.save_geojson(geojson, asset_paths.data, round_coords=False)
             
         except Exception as e:
             logger.error(f"❌ Failed to convert SST data: {str(e)}")
@@ -49,17 +49,17 @@ class WaterMovementContourConverter(BaseGeoJSONConverter):
             lats = data[lat_name].values
             
             # Get valid SSH range
-            valid_ssh = ssh[~np.isnan(ssh)]
-            if len(valid_ssh) == 0:
+            valid_count = int(np.count_nonzero(~np.isnan(ssh)))
+            if valid_count == 0:
                 logger.warning("⚠️  No valid SSH data points found")
                 return self._create_geojson([], date, None, None)
             
-            min_ssh = float(np.min(valid_ssh))
-            max_ssh = float(np.max(valid_ssh))
+            min_ssh = float(np.nanmin(ssh))
+            max_ssh = float(np.nanmax(ssh))
             
             # Generate contours if we have sufficient data
             features = []
-            if len(valid_ssh) >= 10 and (max_ssh - min_ssh) >= 0.05:
+            if valid_count >= 10 and (max_ssh - min_ssh) >= 0.05:
                 try:
                     levels = self._generate_levels(min_ssh, max_ssh)
 
@@ -104,7 +104,7 @@ class WaterMovementContourConverter(BaseGeoJSONConverter):
                     logger.error(f"❌ Failed to generate contours: {str(e)}")
                     return self._create_geojson([], date, min_ssh, max_ssh)
             else:
-                logger.warning(f"❌  Insufficient data for contours: {len(valid_ssh)} points, range: {max_ssh - min_ssh:.3f}m")
+                logger.warning(f"❌  Insufficient data for contours: {valid_count} points, range: {max_ssh - min_ssh:.3f}m")
             
             # Create and save GeoJSON
             geojson = {
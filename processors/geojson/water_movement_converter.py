@@ -1,6 +1,7 @@
 from pathlib import Path
 import logging
 import datetime
+import math
 import numpy as np
 import xarray as xr
 from typing import Dict, List
@@ -23,50 +24,48 @@ class WaterMovementConverter(BaseGeoJSONConverter):
             u_current = data['uo'].values
             v_current = data['vo'].values
             
-            # Create features list
-            features = []
+            # Calculate current speed and direction for the whole grid at once
+            valid = ~(np.isnan(u_current) | np.isnan(v_current))
+            speed = np.hypot(u_current, v_current)
+            direction = np.degrees(np.arctan2(v_current, u_current))
+            
+            # Gather only the valid points, rounding each property column in one call
+            lat_idx, lon_idx = np.nonzero(valid)
+            point_lons = lons[lon_idx].tolist()
+            point_lats = lats[lat_idx].tolist()
+            speeds = np.round(speed[lat_idx, lon_idx], 3).tolist()
+            directions = np.round(direction[lat_idx, lon_idx], 1).tolist()
+            if ssh is not None:
+                ssh_values = np.round(ssh[lat_idx, lon_idx], 3).tolist()
+            else:
+                ssh_values = [math.nan] * len(speeds)
             
-            # Generate a feature for each point
-            for i in range(len(lats)):
-                for j in range(len(lons)):
-                    # Get values at this point
-                    u = float(u_current[i, j])
-                    v = float(v_current[i, j])
-                    
-                    # Skip if currents are invalid
-                    if np.isnan(u) or np.isnan(v):
-                        continue
-                        
-                    # Calculate current speed and direction
-                    speed = float(np.sqrt(u**2 + v**2))
-                    direction = float(np.degrees(np.arctan2(v, u)))
-                    
-                    # Create properties
-                    properties = {
-                        "current_speed": round(speed, 3),
-                        "current_direction": round(direction, 1),
-                        "current_speed_unit": "m/s",
-                        "current_direction_unit": "degrees"
-                    }
-                    
-                    # Add SSH if available
-                    if ssh is not None:
-                        ssh_value = float(ssh[i, j])
-                        if not np.isnan(ssh_value):
-                            properties["ssh"] = round(ssh_value, 3)
-                            properties["ssh_unit"] = "m"
-                    
-                    # Create the feature
-                    feature = {
-                        "type": "Feature",
-                        "geometry": {
-                            "type": "Point",
-                            "coordinates": [float(lons[j]), float(lats[i])]
-                        },
-                        "properties": properties
-                    }
-                    
-                    features.append(feature)
+            # Generate a feature for each valid point
+            features = []
+            for lon, lat, current_speed, current_direction, ssh_value in zip(
+                    point_lons, point_lats, speeds, directions, ssh_values):
+                # Create properties
+                properties = {
+                    "current_speed": current_speed,
+                    "current_direction": current_direction,
+                    "current_speed_unit": "m/s",
+                    "current_direction_unit": "degrees"
+                }
+                
+                # Add SSH if available
+                if not math.isnan(ssh_value):
+                    properties["ssh"] = ssh_value
+                    properties["ssh_unit"] = "m"
+                
+                # Create the feature
+                features.append({
+                    "type": "Feature",
+                    "geometry": {
+                        "type": "Point",
+                        "coordinates": [lon, lat]
+                    },
+                    "properties": properties
+                })
             
             # Create the GeoJSON
             geojson = {
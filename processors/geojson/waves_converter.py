@@ -1,5 +1,4 @@
 import xarray as xr
-import numpy as np
 import logging
 from pathlib import Path
 from datetime import datetime
@@ -19,29 +18,11 @@ class WavesGeoJSONConverter(BaseGeoJSONConverter):
     
     def _create_features(self, data: xr.Dataset) -> List[Dict]:
         """Create GeoJSON features from wave data."""
-        features = []
-        
-        # Get coordinates
-        lons = data['longitude'].values
-        lats = data['latitude'].values
-        
-        # Create features for each point
-        for i in range(len(lats)):
-            for j in range(len(lons)):
-                if not np.isnan(data['height'].values[i, j]):
-                    features.append({
-                        'type': 'Feature',
-                        'geometry': {
-                            'type': 'Point',
-                            'coordinates': [float(lons[j]), float(lats[i])]
-                        },
-                        'properties': {
-                            'height': float(data['height'].values[i, j]),
-                            'direction': float(data['direction'].values[i, j])
-                        }
-                    })
-                    
-        return features
+        return self._generate_features(
+            data['latitude'].values,
+            data['longitude'].values,
+            {'height': data['height'].values, 'direction': data['direction'].values}
+        )
     
     def convert(self, data: xr.Dataset, region: str, dataset: str, date: datetime) -> Path:
         """Convert wave data to GeoJSON format."""
@@ -67,7 +48,7 @@ class WavesGeoJSONConverter(BaseGeoJSONConverter):
             
             # Save and return path
             asset_paths = self.path_manager.get_asset_paths(date, dataset, region)
-            return self.save_geojson(geojson, asset_paths.data)
+            return self.save_geojson(geojson, asset_paths.data, round_coords=False)
             
         except Exception as e:
             logger.error(f"Error processing wave data: {str(e)}")
@@ -20,6 +20,9 @@ from config.regions import REGIONS
 
 logger = logging.getLogger(__name__)
 
+# Dataset types that also get a contour layer
+CONTOUR_DATASET_TYPES = frozenset(['sst', 'chlorophyll', 'water_movement'])
+
 class ProcessingManager:
     """Coordinates data processing workflow"""
     
@@ -161,7 +164,7 @@ class ProcessingManager:
                         }
                 
                 # Merge preprocessed datasets
-                processed_data = xr.merge(datasets_to_merge)
+                processed_data = self._merge_components(datasets_to_merge)
             else:
                 # Handle regular single-source datasets
                 netcdf_path = await self._get_data(date, dataset, region_id)
@@ -192,17 +195,40 @@ class ProcessingManager:
                 'region': region_id
             }
 
+    def _merge_components(self, components: List[xr.Dataset]) -> xr.Dataset:
+        """Merge component datasets, skipping alignment when they already share a grid."""
+        base = components[0]
+        seen_vars = set(base.data_vars)
+        for component in components[1:]:
+            shares_grid = (
+                component.indexes.keys() == base.indexes.keys()
+                and all(component.indexes[name].equals(base.indexes[name]) for name in base.indexes)
+                and all(component.coords[name].equals(base.coords[name])
+                        for name in component.coords if name in base.coords)
+                and seen_vars.isdisjoint(component.data_vars)
+            )
+            if not shares_grid:
+                return xr.merge(components)
+            seen_vars.update(component.data_vars)
+        
+        for component in components[1:]:
+            base = base.assign(component.data_vars)
+        return base
+
     def _calculate_data_ranges(self, data: xr.Dataset) -> Dict:
         """Calculate data ranges for all variables in dataset."""
         ranges = {}
         
         for var in data.data_vars:
-            values = data[var].values
-            valid_data = values[~np.isnan(values)]
-            if len(valid_data) > 0:
+            # Reduce through xarray so dask-backed variables are never fully loaded
+            if data[var].size == 0:
+                continue
+            min_val = float(data[var].min(skipna=True))
+            max_val = float(data[var].max(skipna=True))
+            if not np.isnan(min_val):
                 ranges[var] = {
-                    'min': float(np.min(valid_data)),
-                    'max': float(np.max(valid_data)),
+                    'min': min_val,
+                    'max': max_val,
                     'unit': data[var].attrs.get('units', '')
                 }
                 logger.info(f"[RANGES] {var} min/max: {ranges[var]['min']:.4f} to {ranges[var]['max']:.4f}")
@@ -249,7 +275,7 @@ class ProcessingManager:
                 
             # Generate image layer
             logger.info(f"🎨 Generating image layer")
-            processor = self.visualizer_factory.create(dataset_config['type'])
+            processor = self.visualizer_factory.create(dataset_type)
             image_path = processor.save_image(
                 data=processed_data,
                 region=region_id,
@@ -298,7 +324,7 @@ class ProcessingManager:
             paths['data'] = str(data_path)
         
         # Generate additional layers based on dataset type
-        if dataset_type in ['sst', 'chlorophyll', 'water_movement']:
+        if dataset_type in CONTOUR_DATASET_TYPES:
             logger.info(f"📈 Generating contours")
             contour_converter = self.geojson_converter_factory.create(dataset, 'contours')
             contour_path = contour_converter.convert(
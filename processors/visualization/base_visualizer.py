@@ -10,6 +10,7 @@ from typing import Dict, Optional, Tuple, Any
 from config.settings import IMAGE_SETTINGS
 from config.regions import REGIONS
 from utils.path_manager import PathManager
+from processors.data.data_utils import get_coordinate_names
 from PIL import Image
 from io import BytesIO
 from scipy.ndimage import binary_dilation, distance_transform_edt
@@ -80,9 +81,7 @@ class BaseVisualizer(ABC):
             plt.close(fig)
             
             # Write optimized buffer to file
-            buf.seek(0)
-            with open(output_path, 'wb') as f:
-                f.write(buf.getvalue())
+            output_path.write_bytes(buf.getvalue())
             
             return output_path
             
@@ -131,51 +130,47 @@ class BaseVisualizer(ABC):
             
     def get_coordinate_names(self, data: xr.Dataset) -> tuple:
         """Get standardized coordinate names."""
-        lon_patterns = ['lon', 'longitude', 'x']
-        lat_patterns = ['lat', 'latitude', 'y']
-        
-        lon_name = None
-        lat_name = None
-        
-        for var in data.coords:
-            var_lower = var.lower()
-            if any(pattern in var_lower for pattern in lon_patterns):
-                lon_name = var
-            elif any(pattern in var_lower for pattern in lat_patterns):
-                lat_name = var
-                
-        if not lon_name or not lat_name:
-            raise ValueError("Could not identify coordinate variables")
-            
-        return lon_name, lat_name
+        return get_coordinate_names(data)
             
     def expand_coastal_data(self, data: xr.Dataset) -> xr.Dataset:
         """Expand coastal data points to improve visualization."""
         kernel = np.array([[0, 1, 0], [1, 1, 1], [0, 1, 0]])
-        expanded_data = data.copy()
+        expanded_data = data
+        fill_cache = []
         
         for var in data.data_vars:
             values = data[var].values
             mask = ~np.isnan(values)
-            
-            # Apply dilation
-            expanded_mask = binary_dilation(mask, structure=kernel, iterations=2)
-            
-            # Fill expanded areas with nearest valid value
-            if mask.any():
-                dist, indices = distance_transform_edt(
-                    ~mask, 
-                    return_indices=True
-                )
-                
-                expanded_values = values.copy()
-                expanded_values[expanded_mask] = values[
-                    indices[0][expanded_mask],
-                    indices[1][expanded_mask]
-                ]
-                
-                # Update only the expanded areas
-                values[expanded_mask & ~mask] = expanded_values[expanded_mask & ~mask]
-                expanded_data[var].values = values
+            if mask.all():
+                # No gaps to fill, so skip the dilation and mask comparison entirely
+                continue
+            
+            # Variables on the same grid usually share a NaN mask, so compute
+            # the cells to fill and their nearest valid source once per distinct mask.
+            # Masks are compared directly rather than keyed by tobytes(), which
+            # would copy the whole mask for every variable.
+            cached = next((entry for cached_mask, entry in fill_cache
+                           if np.array_equal(cached_mask, mask)), False)
+            if cached is False:
+                fill = binary_dilation(mask, structure=kernel, iterations=2) & ~mask
+                if mask.any() and fill.any():
+                    indices = distance_transform_edt(
+                        ~mask,
+                        return_distances=False,
+                        return_indices=True
+                    )
+                    cached = (fill, indices[0][fill], indices[1][fill])
+                else:
+                    cached = None
+                fill_cache.append((mask, cached))
+            if cached is None:
+                continue
+            fill, rows, cols = cached
+            
+            # Fill only the newly expanded cells with their nearest valid value,
+            # on a copy of this variable so the input dataset is left untouched
+            filled = values.copy()
+            filled[fill] = values[rows, cols]
+            expanded_data = expanded_data.assign({var: data[var].copy(data=filled)})
                 
         return expanded_data
\ No newline at end of file
@@ -41,19 +41,21 @@ class ChlorophyllVisualizer(BaseVisualizer):
         
     def _plot_chlorophyll(self, ax: plt.Axes, chl_data: xr.DataArray, dataset: str) -> None:
         """Plot chlorophyll field using pcolormesh."""
-        valid_data = chl_data.values[~np.isnan(chl_data.values)]
+        values = chl_data.values
         
         cmap = LinearSegmentedColormap.from_list('chlorophyll', SOURCES[dataset]['color_scale'], N=1024)
 
-        vmin = float(valid_data.min())
-        vmax = float(valid_data.max())
+        vmin = float(np.nanmin(values))
+        vmax = float(np.nanmax(values))
+        if np.isnan(vmin):
+            raise ValueError("No valid chlorophyll data for visualization")
 
         norm = mcolors.LogNorm(vmin=max(vmin, 0.01), vmax=vmax)
 
         ax.pcolormesh(
             chl_data['longitude'],
             chl_data['latitude'],
-            chl_data.values,
+            values,
             transform=ccrs.PlateCarree(),
             cmap=cmap,
             norm=norm,
@@ -19,18 +19,20 @@ class CurrentsVisualizer(BaseVisualizer):
         try:
             # Get velocity components
             u_var, v_var = SOURCES[dataset]['variables']
-            u_data = data[u_var]
-            v_data = data[v_var]
+            # Work on the raw arrays from here on
+            u_values = data[u_var].values
+            v_values = data[v_var].values
             
             # Compute magnitude on the proper grid
             magnitude = xr.DataArray(
-                np.sqrt(u_data**2 + v_data**2),
+                np.hypot(u_values, v_values),
                 coords={'latitude': data.latitude, 'longitude': data.longitude},
                 dims=['latitude', 'longitude']
             )
             
             # Get valid data statistics
-            valid_data = magnitude.values[~np.isnan(magnitude.values)]
+            magnitude_values = magnitude.values
+            valid_data = magnitude_values[~np.isnan(magnitude_values)]
             if len(valid_data) == 0:
                 raise ValueError("No valid current data for visualization")
             
@@ -42,11 +44,11 @@ class CurrentsVisualizer(BaseVisualizer):
             magnitude_threshold = float(np.percentile(valid_data, 5))
         
             # Compute spatial gradients
-            grad_x, grad_y = np.gradient(magnitude.values)
+            grad_x, grad_y = np.gradient(magnitude_values)
             gradient_magnitude = np.sqrt(grad_x**2 + grad_y**2)
             
             # Create interest mask for areas with significant currents or gradients
-            interest_mask = (magnitude.values > magnitude_threshold) | (gradient_magnitude > magnitude_threshold / 2)
+            interest_mask = (magnitude_values > magnitude_threshold) | (gradient_magnitude > magnitude_threshold / 2)
             
             # Create figure and axes
             fig, ax = self.create_axes(region)
@@ -73,17 +75,19 @@ class CurrentsVisualizer(BaseVisualizer):
             nx, ny = len(data.longitude), len(data.latitude)
             skip = max(1, min(nx, ny) // 25)  # Aim for roughly 25 arrows in smallest dimension
             
-            # Create proper coordinate grids for quiver plot
-            lon_mesh, lat_mesh = np.meshgrid(data.longitude[::skip], data.latitude[::skip])
+            # quiver broadcasts 1-D coordinates itself, so no meshgrid is needed
+            arrow_lons = data.longitude.values[::skip]
+            arrow_lats = data.latitude.values[::skip]
             
-            # Prepare masked velocity components
-            u_masked = np.where(interest_mask, u_data, np.nan)[::skip, ::skip]
-            v_masked = np.where(interest_mask, v_data, np.nan)[::skip, ::skip]
+            # Prepare masked velocity components on the arrow grid only
+            arrow_mask = interest_mask[::skip, ::skip]
+            u_masked = np.where(arrow_mask, u_values[::skip, ::skip], np.nan)
+            v_masked = np.where(arrow_mask, v_values[::skip, ::skip], np.nan)
             
             # Add quiver plot with masked velocities
             ax.quiver(
-                lon_mesh,
-                lat_mesh,
+                arrow_lons,
+                arrow_lats,
                 u_masked,
                 v_masked,
                 transform=ccrs.PlateCarree(),
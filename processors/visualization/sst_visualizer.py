@@ -48,13 +48,15 @@ class SSTVisualizer(BaseVisualizer):
         
     def _plot_sst(self, ax: plt.Axes, sst_data: xr.DataArray) -> None:
         """Plot SST field using pcolormesh."""
-        valid_data = sst_data.values[~np.isnan(sst_data.values)]
-        vmin, vmax = float(np.nanmin(valid_data)), float(np.nanmax(valid_data))
+        values = sst_data.values
+        vmin, vmax = float(np.nanmin(values)), float(np.nanmax(values))
+        if np.isnan(vmin):
+            raise ValueError("No valid SST data for visualization")
         
         ax.pcolormesh(
             sst_data['longitude'],
             sst_data['latitude'],
-            sst_data.values,
+            values,
             transform=ccrs.PlateCarree(),
             cmap='RdYlBu_r',
             shading='gouraud',
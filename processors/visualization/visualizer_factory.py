@@ -1,7 +1,7 @@
 from typing import Dict, Type
 from .base_visualizer import BaseVisualizer
 from utils.path_manager import PathManager
-from ..factory_config import PROCESSOR_MAPPING
+from ..factory_config import PROCESSOR_MAPPING, load_processor
 import logging
 
 logger = logging.getLogger(__name__)
@@ -17,5 +17,5 @@ class VisualizerFactory:
         if dataset_type not in PROCESSOR_MAPPING:
             raise ValueError(f"Visualizer type {dataset_type} not supported")
             
-        visualizer_class = PROCESSOR_MAPPING[dataset_type]['visualizer']
+        visualizer_class = load_processor(PROCESSOR_MAPPING[dataset_type].visualizer)
         return visualizer_class(self.path_manager)
\ No newline at end of file
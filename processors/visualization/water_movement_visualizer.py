@@ -79,13 +79,15 @@ class WaterMovementVisualizer(BaseVisualizer):
         
     def _plot_ssh(self, ax: plt.Axes, ssh_data: xr.DataArray) -> None:
         """Plot SSH field using pcolormesh."""
-        valid_data = ssh_data.values[~np.isnan(ssh_data.values)]
-        vmin, vmax = float(np.nanmin(valid_data)), float(np.nanmax(valid_data))
+        values = ssh_data.values
+        vmin, vmax = float(np.nanmin(values)), float(np.nanmax(values))
+        if np.isnan(vmin):
+            raise ValueError("No valid SSH data for visualization")
         
         ax.pcolormesh(
             ssh_data['longitude'],
             ssh_data['latitude'],
-            ssh_data.values,
+            values,
             transform=ccrs.PlateCarree(),
             cmap=self._ssh_cmap,
             shading='gouraud',
@@ -101,16 +103,20 @@ class WaterMovementVisualizer(BaseVisualizer):
         nx, ny = len(u_data.longitude), len(u_data.latitude)
         skip = max(1, min(nx, ny) // self.arrow_spacing)
         
-        # Create grid
-        lon_mesh, lat_mesh = np.meshgrid(u_data.longitude[::skip], u_data.latitude[::skip])
+        # 1-D arrow coordinates; quiver broadcasts them against the vector grid
+        arrow_lons = u_data.longitude.values[::skip]
+        arrow_lats = u_data.latitude.values[::skip]
         
-        # Process vectors
-        magnitude = np.sqrt(u_data**2 + v_data**2)
-        threshold = float(np.percentile(magnitude.values[~np.isnan(magnitude.values)], 5))
-        mask = magnitude.values > threshold
+        # Process vectors on the raw arrays
+        u_values = u_data.values
+        v_values = v_data.values
+        magnitude = np.hypot(u_values, v_values)
+        threshold = float(np.percentile(magnitude[~np.isnan(magnitude)], 5))
+        mask = magnitude > threshold
         
-        u_masked = np.where(mask, u_data.values, np.nan)[::skip, ::skip]
-        v_masked = np.where(mask, v_data.values, np.nan)[::skip, ::skip]
+        arrow_mask = mask[::skip, ::skip]
+        u_masked = np.where(arrow_mask, u_values[::skip, ::skip], np.nan)
+        v_masked = np.where(arrow_mask, v_values[::skip, ::skip], np.nan)
         
         # Normalize
         mag_subset = np.sqrt(u_masked**2 + v_masked**2)
@@ -120,8 +126,8 @@ class WaterMovementVisualizer(BaseVisualizer):
         
         # Plot
         ax.quiver(
-            lon_mesh,
-            lat_mesh,
+            arrow_lons,
+            arrow_lats,
             u_norm,
             v_norm,
             transform=ccrs.PlateCarree(),
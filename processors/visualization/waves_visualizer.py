@@ -44,20 +44,20 @@ class WavesVisualizer(BaseVisualizer):
             )
             
             # Calculate data range
-            valid_data = height.values[~np.isnan(height.values)]
-            if len(valid_data) == 0:
+            height_values = height.values
+            vmin = float(np.nanmin(height_values))
+            vmax = float(np.nanmax(height_values))
+            if np.isnan(vmin):
                 logger.error("No valid wave height data found in dataset")
                 raise ValueError("No valid wave height data")
                 
-            vmin = float(np.min(valid_data))
-            vmax = float(np.max(valid_data))
             logger.info(f"Wave height range (ft): {vmin:.2f} to {vmax:.2f}")
             
             # Create pcolormesh for wave heights
             mesh = ax.pcolormesh(
                 data[longitude],
                 data[latitude],
-                height.values,
+                height_values,
                 transform=ccrs.PlateCarree(),
                 cmap=cmap,
                 vmin=vmin,
@@ -84,8 +84,8 @@ class CMEMSService:
                 if not output_path.exists():
                     raise ValueError("Download failed - no output file created")
                 
-                # Verify downloaded data with decode_times=False
-                with xr.open_dataset(output_path, decode_times=False) as ds:
+                # Verify downloaded data; times are not needed and each variable is read once
+                with xr.open_dataset(output_path, engine='netcdf4', decode_times=False, cache=False) as ds:
                     for var in var_list:
                         if var not in ds.variables:
                             raise ValueError(f"Downloaded data missing variable: {var}")